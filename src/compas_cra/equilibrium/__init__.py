@@ -12,6 +12,8 @@ from .cra_helper import (
     num_vertices,
     num_free,
     free_nodes,
+    geometry_key,
+    setup_cache,
 )
 from .pyomo_helper import (
     initialisations,
@@ -19,7 +21,14 @@ from .pyomo_helper import (
     objectives,
     constraints,
     static_equilibrium_constraints,
+    virtual_displacement_constraints,
+    model_cache,
+    update_parameters,
+    linear_expressions,
+    ipopt_solver,
+    ipopt_solve,
     pyomo_result_check,
+    pyomo_result_contact,
     pyomo_result_assembly,
 )
 
@@ -37,11 +46,20 @@ __all__ = [
     "num_vertices",
     "num_free",
     "free_nodes",
+    "geometry_key",
+    "setup_cache",
     "initialisations",
     "bounds",
     "objectives",
     "constraints",
     "static_equilibrium_constraints",
+    "virtual_displacement_constraints",
+    "model_cache",
+    "update_parameters",
+    "linear_expressions",
+    "ipopt_solver",
+    "ipopt_solve",
     "pyomo_result_check",
+    "pyomo_result_contact",
     "pyomo_result_assembly",
 ]
@@ -3,8 +3,9 @@
 import math as mt
 
 import numpy as np
-from compas.geometry import cross_vectors
 from scipy.sparse import csr_matrix
+from scipy.sparse import identity
+from scipy.sparse import kron
 
 
 def equilibrium_setup(assembly, penalty=False):
@@ -22,10 +23,30 @@ def equilibrium_setup(assembly, penalty=False):
     :class:`~scipy.sparse.csr_matrix`
         Equilibrium matrix Aeq (penalty=False) or Equilibrium penalty matrix Aeq@B (penalty=True).
 
+    Notes
+    -----
+    The matrix is cached on the assembly and reused as long as its geometry does not change,
+    see :func:`setup_cache`. Entries below 1e-12 relative to the largest entry are removed.
+    The returned matrix is the cached one and is shared by all later calls, so it must not be modified in place.
+
     """
-    free = free_nodes(assembly)
-    aeq = make_aeq(assembly, penalty=penalty)
-    aeq = aeq[[index * 6 + i for index in free for i in range(6)], :]
+    cache = setup_cache(assembly)
+    name = "aeq_b" if penalty else "aeq"
+    if name not in cache:
+        free = np.array(free_nodes(assembly), dtype=int)
+        aeq = make_aeq(assembly, penalty=penalty)
+        rows = (free[:, np.newaxis] * 6 + np.arange(6)).ravel()
+        selector = csr_matrix(
+            (np.ones(len(rows)), (np.arange(len(rows)), rows)),
+            shape=(len(rows), aeq.shape[0]),
+        )  # picks the rows of the free blocks
+        aeq = selector @ aeq
+        if aeq.nnz:
+            # drop the floating point noise of the cross products, it only adds Jacobian nonzeros
+            aeq.data[np.abs(aeq.data) < 1e-12 * np.abs(aeq.data).max()] = 0
+            aeq.eliminate_zeros()
+        cache[name] = aeq
+    aeq = cache[name]
     print("Aeq: ", aeq.shape)
 
     return aeq
@@ -50,9 +71,19 @@ def friction_setup(assembly, mu, penalty=False, friction_net=False):
     :class:`~scipy.sparse.csr_matrix`
         Afr (penalty=False) or Afr@B (penalty=True)
 
+    Notes
+    -----
+    The matrix of the last mu and formulation is cached on the assembly and reused as long as
+    neither they nor its geometry change, see :func:`setup_cache`.
+    The returned matrix is the cached one and is shared by all later calls, so it must not be modified in place.
+
     """
-    v_count = num_vertices(assembly)
-    afr = make_afr(v_count, fcon_number=8, mu=mu, penalty=penalty, friction_net=friction_net)
+    cache = setup_cache(assembly)
+    key = (mu, penalty, friction_net)
+    if cache.get("afr", (None, None))[0] != key:
+        v_count = num_vertices(assembly)
+        cache["afr"] = (key, make_afr(v_count, fcon_number=8, mu=mu, penalty=penalty, friction_net=friction_net))
+    afr = cache["afr"][1]
     print("Afr: ", afr.shape)
 
     return afr
@@ -74,20 +105,25 @@ def external_force_setup(assembly, density):
     :class:`~numpy.ndarray`
         External force p.
 
+    Notes
+    -----
+    The block volumes are cached on the assembly, see :func:`setup_cache`.
+
     """
     free = free_nodes(assembly)
 
     num_nodes = assembly.graph.number_of_nodes()
-    key_index = {key: index for index, key in enumerate(assembly.graph.nodes())}
+    blocks = [assembly.node_block(node) for node in assembly.graph.nodes()]
 
-    p = [[0, 0, 0, 0, 0, 0] for i in range(num_nodes)]
-    for node in assembly.graph.nodes():
-        block = assembly.node_block(node)
-        index = key_index[node]
-        p[index][2] = -block.volume() * (block.attributes["density"] if "density" in block.attributes else density)
-        print((block.attributes["density"] if "density" in block.attributes else density))
+    cache = setup_cache(assembly)
+    if "volumes" not in cache:
+        cache["volumes"] = np.fromiter((block.volume() for block in blocks), dtype=float, count=num_nodes)
+    densities = np.fromiter(
+        (block.attributes.get("density", density) for block in blocks), dtype=float, count=num_nodes
+    )
 
-    p = np.array(p, dtype=float)
+    p = np.zeros((num_nodes, 6))
+    p[:, 2] = -cache["volumes"] * densities
     p = p[free, :].reshape((-1, 1), order="C")
 
     return p
@@ -115,6 +151,71 @@ def density_setup(assembly, density):
             block.attributes["density"] = density[node]
 
 
+def geometry_key(assembly):
+    """Return a fingerprint of the assembly geometry used by the CRA matrices.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_assembly.datastructures.Assembly`
+        The rigid block assembly.
+
+    Returns
+    -------
+    int
+        Hash of the node keys, supports, block vertices, and interface points and frames.
+
+    """
+    nodes = []
+    for node in assembly.graph.nodes():
+        block = assembly.graph.node_attribute(node, "block")
+        nodes.append(
+            (
+                node,
+                bool(assembly.graph.node_attribute(node, "is_support")),
+                tuple(tuple(xyz) for xyz in block.vertices_attributes("xyz")),
+            )
+        )
+    edges = []
+    for edge in assembly.graph.edges():
+        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
+            frame = interface.frame
+            edges.append(
+                (
+                    edge,
+                    tuple(tuple(xyz) for xyz in interface.points),
+                    tuple(frame.point),
+                    tuple(frame.xaxis),
+                    tuple(frame.yaxis),
+                )
+            )
+    return hash((tuple(nodes), tuple(edges)))
+
+
+def setup_cache(assembly):
+    """Return the cache of CRA matrices stored on the assembly.
+
+    The cache is emptied whenever the geometry of the assembly changed since it was last used,
+    so repeated solves of the same assembly, e.g. with a different density, reuse the matrices.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_assembly.datastructures.Assembly`
+        The rigid block assembly.
+
+    Returns
+    -------
+    dict
+        The cached matrices of the current geometry.
+
+    """
+    key = geometry_key(assembly)
+    cache = getattr(assembly, "_cra_cache", None)
+    if cache is None or cache["key"] != key:
+        cache = {"key": key}
+        assembly._cra_cache = cache
+    return cache
+
+
 def num_free(assembly):
     """Return number of free blocks.
 
@@ -142,17 +243,17 @@ def free_nodes(assembly):
 
     Returns
     -------
-    free_block : float
-        Node id of free node/blocks
+    free_block : list of int
+        Sorted indices of free node/blocks
 
     """
     num_nodes = assembly.graph.number_of_nodes()
-    key_index = {key: index for index, key in enumerate(assembly.graph.nodes())}
-
-    fixed = list(key for key in assembly.graph.nodes_where({"is_support": True}))
-    fixed = [key_index[key] for key in fixed]
-    free = list(set(range(num_nodes)) - set(fixed))
-    return free
+    fixed = np.fromiter(
+        (bool(assembly.graph.node_attribute(key, "is_support")) for key in assembly.graph.nodes()),
+        dtype=bool,
+        count=num_nodes,
+    )
+    return np.flatnonzero(~fixed).tolist()
 
 
 def num_vertices(assembly):
@@ -205,27 +306,28 @@ def make_aeq(assembly, flip=False, penalty=False):
         shift = 4
 
     key_index = {key: index for index, key in enumerate(assembly.graph.nodes())}
+    centers = {key: assembly.graph.node_attribute(key, "block").center() for key in key_index}
 
     for b_j, b_k in assembly.graph.edges(False):
-        bj_center = assembly.graph.node_attribute(b_j, "block").center()
-        bk_center = assembly.graph.node_attribute(b_k, "block").center()
-
         for interface in assembly.graph.edge_attribute((b_j, b_k), "interfaces"):
             # B_j
-            block_rows, block_cols, block_data = aeq_block(interface, bj_center, not flip, penalty)
+            block_rows, block_cols, block_data = aeq_block(interface, centers[b_j], not flip, penalty)
             # shift rows and cols
-            rows += [row + 6 * key_index[b_j] for row in block_rows]
-            cols += [col + shift * count for col in block_cols]
-            data += block_data
+            rows.append(block_rows + 6 * key_index[b_j])
+            cols.append(block_cols + shift * count)
+            data.append(block_data)
             # B_k
-            block_rows, block_cols, block_data = aeq_block(interface, bk_center, flip, penalty)
+            block_rows, block_cols, block_data = aeq_block(interface, centers[b_k], flip, penalty)
             # shift rows and cols
-            rows += [row + 6 * key_index[b_k] for row in block_rows]
-            cols += [col + shift * count for col in block_cols]
-            data += block_data
+            rows.append(block_rows + 6 * key_index[b_k])
+            cols.append(block_cols + shift * count)
+            data.append(block_data)
             count += len(interface.points)
 
-    return csr_matrix((data, (rows, cols)))
+    shape = (6 * len(key_index), shift * count)
+    if not data:
+        return csr_matrix(shape)
+    return csr_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))), shape=shape)
 
 
 def aeq_block(interface, center, reverse, penalty=False):
@@ -244,7 +346,7 @@ def aeq_block(interface, center, reverse, penalty=False):
 
     Returns
     -------
-    rows, cols, data : list, list, list
+    rows, cols, data : :class:`~numpy.ndarray`, :class:`~numpy.ndarray`, :class:`~numpy.ndarray`
         rows, cols, data for the constructing the sparse matrix.
 
     """
@@ -252,60 +354,27 @@ def aeq_block(interface, center, reverse, penalty=False):
     if penalty:
         shift = 4
 
-    rows, cols, data = [], [], []
-    u = interface.frame.xaxis
-    v = interface.frame.yaxis
-    w = interface.frame.zaxis
+    frame = interface.frame
+    u, v, w = np.array([frame.xaxis, frame.yaxis, frame.zaxis], dtype=float)
 
     if reverse:
-        u = [-1.0 * axis for axis in u]
-        v = [-1.0 * axis for axis in v]
-        w = [-1.0 * axis for axis in w]
-
-    fx = [w[0], -w[0], u[0], v[0]] if penalty else [w[0], u[0], v[0]]
-    fy = [w[1], -w[1], u[1], v[1]] if penalty else [w[1], u[1], v[1]]
-    fz = [w[2], -w[2], u[2], v[2]] if penalty else [w[2], u[2], v[2]]
-
-    for i, xyz in enumerate(interface.points):
-        # coordinates of interface point relative to block mass center
-        rxyz = [xyz[axis] - center[axis] for axis in range(3)]
-        # moments
-        mu = cross_vectors(rxyz, u)
-        mv = cross_vectors(rxyz, v)
-        mw = cross_vectors(rxyz, w)
-
-        mx = [mw[0], -mw[0], mu[0], mv[0]] if penalty else [mw[0], mu[0], mv[0]]
-        my = [mw[1], -mw[1], mu[1], mv[1]] if penalty else [mw[1], mu[1], mv[1]]
-        mz = [mw[2], -mw[2], mu[2], mv[2]] if penalty else [mw[2], mu[2], mv[2]]
-
-        for j in range(shift):
-            col = j + (i * shift)
-            if fx[j]:
-                rows.append(0)
-                cols.append(col)
-                data.append(fx[j])
-            if fy[j]:
-                rows.append(1)
-                cols.append(col)
-                data.append(fy[j])
-            if fz[j]:
-                rows.append(2)
-                cols.append(col)
-                data.append(fz[j])
-            if mx[j]:
-                rows.append(3)
-                cols.append(col)
-                data.append(mx[j])
-            if my[j]:
-                rows.append(4)
-                cols.append(col)
-                data.append(my[j])
-            if mz[j]:
-                rows.append(5)
-                cols.append(col)
-                data.append(mz[j])
-
-    return rows, cols, data
+        u, v, w = -u, -v, -w
+
+    # coordinates of interface points relative to block mass center
+    rxyz = np.asarray(interface.points, dtype=float) - np.asarray(center, dtype=float)
+    # moments
+    mu = np.cross(rxyz, u)
+    mv = np.cross(rxyz, v)
+    mw = np.cross(rxyz, w)
+
+    f = np.array([w, -w, u, v] if penalty else [w, u, v])  # shift x 3
+    m = np.stack([mw, -mw, mu, mv] if penalty else [mw, mu, mv], axis=1)  # points x shift x 3
+
+    # entry [i, j, k] is row k (fx, fy, fz, mx, my, mz) of column j + i * shift
+    block = np.concatenate((np.broadcast_to(f, m.shape), m), axis=2)
+    i, j, k = np.nonzero(block)
+
+    return k, j + i * shift, block[i, j, k]
 
 
 def unit_basis(assembly, penalty=False):
@@ -323,22 +392,33 @@ def unit_basis(assembly, penalty=False):
     :class:`~numpy.ndarray`
         the basis matrix # is Nx3
 
+    Notes
+    -----
+    The basis is cached on the assembly and reused as long as its geometry does not change,
+    see :func:`setup_cache`. The returned array is shared by all later calls, so it must not be modified in place.
+
     """
-    basis = []
+    cache = setup_cache(assembly)
+    name = ("basis", penalty)
+    if name in cache:
+        return cache[name]
+
+    frames = []
+    counts = []
     for edge in assembly.graph.edges():
         interfaces = assembly.graph.edge_attribute(edge, "interfaces")
 
         for interface in interfaces:
-            u = interface.frame.xaxis
-            v = interface.frame.yaxis
-            w = interface.frame.zaxis
-            for i in range(len(interface.points)):
-                basis.append([w[0], w[1], w[2]])
-                if penalty:
-                    basis.append([-w[0], -w[1], -w[2]])
-                basis.append([u[0], u[1], u[2]])
-                basis.append([v[0], v[1], v[2]])
-    return np.array(basis)
+            frame = interface.frame
+            frames.append([frame.zaxis, frame.xaxis, frame.yaxis])
+            counts.append(len(interface.points))
+
+    frames = np.array(frames, dtype=float).reshape((-1, 3, 3))  # w, u, v of each interface
+    if penalty:
+        frames = np.concatenate((frames[:, :1], -frames[:, :1], frames[:, 1:]), axis=1)  # w, -w, u, v
+    basis = np.repeat(frames, counts, axis=0)  # one frame per interface vertex
+    cache[name] = np.ascontiguousarray(basis.reshape((-1, 3)))
+    return cache[name]
 
 
 def make_afr(total_vcount, fcon_number=8, mu=0.8, penalty=False, friction_net=False):
@@ -362,10 +442,17 @@ def make_afr(total_vcount, fcon_number=8, mu=0.8, penalty=False, friction_net=Fa
     :class:`~scipy.sparse.csr_matrix`
         the basis matrix # Nx3
 
+    Notes
+    -----
+    The friction cone of every vertex is the same, so the matrix is the block diagonal
+    of a single vertex block, assembled directly in CSR format.
+
     """
     if penalty:
-        return _make_afr_b(total_vcount, fcon_number=fcon_number, mu=mu, friction_net=friction_net)
-    return _make_afr(total_vcount, fcon_number=8, mu=mu)
+        afr = _make_afr_b(1, fcon_number=fcon_number, mu=mu, friction_net=friction_net)
+    else:
+        afr = _make_afr(1, fcon_number=8, mu=mu)
+    return kron(identity(total_vcount, format="csr"), afr, format="csr")
 
 
 def _make_afr(total_vcount, fcon_number=8, mu=0.8):
@@ -14,10 +14,17 @@ from .cra_helper import num_vertices
 from .cra_helper import unit_basis
 from .pyomo_helper import bounds
 from .pyomo_helper import constraints
+from .pyomo_helper import ipopt_solve
+from .pyomo_helper import ipopt_solver
+from .pyomo_helper import linear_expressions
+from .pyomo_helper import model_cache
 from .pyomo_helper import objectives
 from .pyomo_helper import pyomo_result_assembly
 from .pyomo_helper import pyomo_result_check
+from .pyomo_helper import pyomo_result_contact
 from .pyomo_helper import static_equilibrium_constraints
+from .pyomo_helper import update_parameters
+from .pyomo_helper import virtual_displacement_constraints
 
 
 def cra_penalty_solve(
@@ -28,6 +35,8 @@ def cra_penalty_solve(
     eps: float = 1e-4,
     verbose: bool = False,
     timer: bool = False,
+    warm_start: bool = False,
+    linear_solver: str = None,
 ) -> Assembly:
     r"""CRA solver with penalty formulation using Pyomo + IPOPT.
 
@@ -47,6 +56,10 @@ def cra_penalty_solve(
         Print information during the execution of the algorithm.
     timer : bool, optional
         Time the solving time.
+    warm_start : bool, optional
+        Start from the solution of the previous solve of the same assembly.
+    linear_solver : str, optional
+        IPOPT linear solver, e.g. ``ma57`` if the HSL library is installed, by default IPOPT's default.
 
     Returns
     -------
@@ -85,6 +98,54 @@ def cra_penalty_solve(
     if timer:
         start_time = time.time()
 
+    aeq = equilibrium_setup(assembly, penalty=False)
+    p = external_force_setup(assembly, density)
+
+    cache = model_cache(assembly)
+    cached_mu, model = cache.get("cra_penalty_model", (None, None))
+    if model is None or cached_mu != mu:
+        model = _cra_penalty_model(assembly, mu, p, d_bnd, eps)
+        cache["cra_penalty_model"] = (mu, model)  # one model per assembly, replaced when mu changes
+    else:
+        update_parameters(model, p, d_bnd, eps)
+        if not warm_start:
+            model.f.set_values(dict.fromkeys(model.f_id, 0))
+            model.q.set_values(dict.fromkeys(model.q_id, 0))
+            model.alpha.set_values(dict.fromkeys(model.v_id, 0))
+
+    if timer:
+        print("--- set up time: %s seconds ---" % (time.time() - start_time))
+    print("finished setup... now trying to solve it...")
+    if timer:
+        start_time = time.time()
+
+    solver = ipopt_solver(verbose, linear_solver)
+    solver.options["tol"] = 1e-8  # same as default tolerance
+    solver.options["constr_viol_tol"] = 1e-7  # constraint tolerance
+    solver.options["acceptable_tol"] = 1e-6
+    solver.options["acceptable_constr_viol_tol"] = 1e-5
+    solver.options["jac_d_constant"] = "yes"  # inequality constraints are all linear
+    # https://coin-or.github.io/Ipopt/OPTIONS.html
+    result = ipopt_solve(solver, model, tee=verbose)
+
+    if timer:
+        print("--- solving time: %s seconds ---" % (time.time() - start_time))
+
+    if verbose:
+        pyomo_result_contact(model, aeq, penalty=True)
+        model.q.display()
+        model.alpha.display()
+        print("objective value: ")
+        model.obj.display()
+
+    pyomo_result_check(result)
+    pyomo_result_assembly(model, assembly, penalty=True, verbose=verbose)
+
+    return assembly
+
+
+def _cra_penalty_model(assembly, mu, p, d_bnd, eps):
+    """Build the pyomo model of the CRA penalty problem, the model only depends on the geometry and mu."""
     model = pyo.ConcreteModel()
 
     v_num = num_vertices(assembly)  # number of vertices
@@ -94,68 +155,41 @@ def cra_penalty_solve(
 
     model.v_id = pyo.Set(initialize=range(v_num))  # vertex indices
     model.f_id = pyo.Set(initialize=range(v_num * 4))  # force indices
-    model.d_id = pyo.Set(initialize=range(v_num * 3))  # displacement indices
     model.q_id = pyo.Set(initialize=range(free_num * 6))  # q indices
 
     model.f = pyo.Var(model.f_id, initialize=0, domain=bounds("f_tilde"))
     model.q = pyo.Var(model.q_id, initialize=0)
     model.alpha = pyo.Var(model.v_id, initialize=0, within=pyo.NonNegativeReals)
+    model.eps = pyo.Param(initialize=eps, mutable=True)
 
-    model.array_f = np.array([model.f[i] for i in model.f_id])
-    model.array_q = np.array([model.q[i] for i in model.q_id])
+    model.array_f = np.fromiter(model.f.values(), dtype=object, count=len(model.f_id))
+    model.array_q = np.fromiter(model.q.values(), dtype=object, count=len(model.q_id))
 
     aeq = equilibrium_setup(assembly, penalty=False)
     aeq_b = equilibrium_setup(assembly, penalty=True)
     afr_b = friction_setup(assembly, mu, penalty=True)
-    p = external_force_setup(assembly, density)
 
-    model.d = aeq.toarray().T @ model.array_q
-    model.forces = f_basis * model.array_f[:, np.newaxis]  # force x in global coordinate
-    model.displs = d_basis * model.d[:, np.newaxis]  # displacement d in global coordinate
+    aeq_t = aeq.T.tocsr()  # δd = Aeq^T δq, shared by d and its constraints
+
+    model.d = linear_expressions(aeq_t, model.array_q)
+    model.f_basis = f_basis.tolist()  # force f in global coordinate: f_basis * f
+    model.d_basis = d_basis.tolist()  # displacement d in global coordinate: d_basis * d
 
     obj_cra_penalty = objectives("cra_penalty")
-    bound_d = bounds("d", d_bnd)
-    constraint_contact = constraints("penalty_contact", eps)
-    constraint_no_penetration = constraints("no_penetration", eps)
+    constraint_contact = constraints("penalty_contact", model.eps)
     constraint_penalty_ft_dt = constraints("penalty_ft_dt")
     constraint_fn_np = constraints("fn_np")
 
     eq_con, fr_con = static_equilibrium_constraints(model, aeq_b, afr_b, p)
+    d_con, p_con = virtual_displacement_constraints(model, aeq_t, d_bnd, eps)
 
     model.obj = pyo.Objective(rule=obj_cra_penalty, sense=pyo.minimize)
     model.ceq = eq_con
     model.cfr = fr_con
-    model.d_bnd = pyo.Constraint(model.d_id, rule=bound_d)
+    model.d_bnd = d_con
     model.c_con = pyo.Constraint(model.v_id, rule=constraint_contact)
-    model.p_con = pyo.Constraint(model.v_id, rule=constraint_no_penetration)
+    model.p_con = p_con
     model.fn_np = pyo.Constraint(model.v_id, rule=constraint_fn_np)
-    model.ft_dt = pyo.Constraint(model.v_id, [i for i in range(3)], rule=constraint_penalty_ft_dt)
+    model.ft_dt = pyo.Constraint(model.v_id, range(3), rule=constraint_penalty_ft_dt)
 
-    if timer:
-        print("--- set up time: %s seconds ---" % (time.time() - start_time))
-    print("finished setup... now trying to solve it...")
-    if timer:
-        start_time = time.time()
-
-    solver = pyo.SolverFactory("ipopt")
-    solver.options["tol"] = 1e-8  # same as default tolerance
-    solver.options["constr_viol_tol"] = 1e-7  # constraint tolerance
-    solver.options["acceptable_tol"] = 1e-6
-    solver.options["acceptable_constr_viol_tol"] = 1e-5
-    # https://coin-or.github.io/Ipopt/OPTIONS.html
-    result = solver.solve(model, tee=verbose)
-
-    if timer:
-        print("--- solving time: %s seconds ---" % (time.time() - start_time))
-
-    if verbose:
-        model.f.display()
-        model.q.display()
-        model.alpha.display()
-        print("objective value: ")
-        model.obj.display()
-
-    pyomo_result_check(result)
-    pyomo_result_assembly(model, assembly, penalty=True, verbose=verbose)
-
-    return assembly
+    return model
@@ -1,11 +1,26 @@
 """Some functions to help building pyomo optimisation problems"""
 
+import sys
+from ctypes.util import find_library
+from functools import lru_cache
 from typing import Callable
 from typing import Literal
+from weakref import WeakKeyDictionary
 
 import pyomo.environ as pyo
+from numpy import arange
+from numpy import column_stack
+from numpy import empty
+from numpy import flatnonzero
+from numpy import fromiter
+from numpy import full
+from numpy import savetxt
 from numpy import zeros
+from pyomo.common.errors import ApplicationError
 from pyomo.core.base.matrix_constraint import MatrixConstraint
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+from .cra_helper import setup_cache
 
 
 def initialisations(
@@ -114,10 +129,7 @@ def objectives(
     def obj_cra(model):
         """CRA objective function"""
         alpha_sum = pyo.dot_product(model.alpha, model.alpha)
-        f_sum = 0
-        for i in model.f_id:
-            if i % 3 == 0:
-                f_sum = f_sum + (model.f[i] * model.f[i])
+        f_sum = pyo.dot_product(model.f, model.f, index=range(0, len(model.f_id), 3))  # fn
         return f_sum + alpha_sum
 
     def obj_cra_penalty(model):
@@ -127,15 +139,12 @@ def objectives(
         return alpha_sum + f_sum
 
     def _obj_weights(model):
-        f_sum = 0
-        for i in model.f_id:
-            if i % 4 == 1:
-                f_sum = f_sum + (model.f[i] * model.f[i] * weights[2])  # tension
-            elif i % 4 == 0:
-                f_sum = f_sum + (model.f[i] * model.f[i] * weights[1])  # compression
-            elif i % 4 == 2 or i % 3 == 0:
-                f_sum = f_sum + (model.f[i] * model.f[i] * weights[3])  # friction
-        return f_sum
+        f_id = arange(len(model.f_id))
+        w = zeros(len(f_id))
+        w[f_id % 4 == 0] = weights[1]  # compression
+        w[f_id % 4 == 1] = weights[2]  # tension
+        w[(f_id % 4 == 2) | ((f_id % 4 == 3) & (f_id % 3 == 0))] = weights[3]  # friction
+        return pyo.dot_product(w.tolist(), model.f, model.f, index=flatnonzero(w).tolist())
 
     if solver == "cra":
         return obj_cra
@@ -167,8 +176,8 @@ def constraints(
         * no_penetration: no penetration constraint, :math:`{f_{jkn}^{i+}}\:({\delta d_{jkn}^i} + eps) = 0`
         * ft_dt: friction and virtual sliding alignment, :math:`f_{jkt}^{i} = -{\alpha_{jk}^i} \: \delta{d}_{jkt}^{i}`
         * penalty_ft_dt: penalty formulation friction and virtual sliding alignment, :math:`f_{jkt}^{i} = -{\alpha_{jk}^i} \: \delta{d}_{jkt}^{i}`
-    eps : float, optional
-        epsilon, overlapping parameter
+    eps : float or :class:`pyomo.core.base.param.Param`, optional
+        epsilon, overlapping parameter, a mutable Param can be updated without rebuilding the constraints
 
     Returns
     -------
@@ -177,21 +186,26 @@ def constraints(
 
     """  # noqa: E501
 
+    # rules index model.array_f, the plain array of the force variables, rather than the indexed model.f,
+    # which saves the index validation of model.f[...] on every term of every vertex,
+    # and model.f_basis / model.d_basis are nested lists of python floats, as numpy scalar coefficients
+    # go through numpy's operator dispatch before reaching pyomo's
+
     def contact_con(model, i):
         """contact constraint"""
         dn = model.d[i * 3]
-        fn = model.f[i * 3]
+        fn = model.array_f[i * 3]
         return ((dn + eps) * fn, 0)
 
     def penalty_contact_con(model, i):
         """penalty formulation contact constraint"""
         dn = model.d[i * 3]
-        fn = model.f[i * 4]
+        fn = model.array_f[i * 4]
         return ((dn + eps) * fn, 0)
 
     def fn_np_con(model, i):
         """fn+ and fn- cannot coexist constraints"""
-        return (model.f[i * 4] * model.f[i * 4 + 1], 0)
+        return (model.array_f[i * 4] * model.array_f[i * 4 + 1], 0)
 
     def no_penetration_con(m, t):
         """no penetration constraint"""
@@ -199,15 +213,17 @@ def constraints(
 
     def ft_dt_con(model, i, xyz):
         """friction and virtual sliding alignment"""
-        d_t = model.displs[i * 3 + 1] + model.displs[i * 3 + 2]
-        f_t = model.forces[i * 3 + 1] + model.forces[i * 3 + 2]
-        return (f_t[xyz], -d_t[xyz] * model.alpha[i])
+        d_t = model.d_basis[i * 3 + 1][xyz] * model.d[i * 3 + 1] + model.d_basis[i * 3 + 2][xyz] * model.d[i * 3 + 2]
+        f = model.array_f
+        f_t = model.f_basis[i * 3 + 1][xyz] * f[i * 3 + 1] + model.f_basis[i * 3 + 2][xyz] * f[i * 3 + 2]
+        return (f_t, -d_t * model.alpha[i])
 
     def penalty_ft_dt_con(model, i, xyz):
         """penalty formulation friction and virtual sliding alignment"""
-        d_t = model.displs[i * 3 + 1] + model.displs[i * 3 + 2]
-        f_t = model.forces[i * 4 + 2] + model.forces[i * 4 + 3]
-        return (f_t[xyz], -d_t[xyz] * model.alpha[i])
+        d_t = model.d_basis[i * 3 + 1][xyz] * model.d[i * 3 + 1] + model.d_basis[i * 3 + 2][xyz] * model.d[i * 3 + 2]
+        f = model.array_f
+        f_t = model.f_basis[i * 4 + 2][xyz] * f[i * 4 + 2] + model.f_basis[i * 4 + 3][xyz] * f[i * 4 + 3]
+        return (f_t, -d_t * model.alpha[i])
 
     if name == "contact":
         return contact_con
@@ -244,21 +260,241 @@ def static_equilibrium_constraints(model, aeq, afr, p) -> Callable:
 
     """
 
-    equilibrium_constraints = MatrixConstraint(
-        aeq.data, aeq.indices, aeq.indptr, -p.flatten(), -p.flatten(), model.array_f
-    )
+    model.b = -p.ravel()  # right hand side, kept to be updated in place
+    equilibrium_constraints = MatrixConstraint(aeq.data, aeq.indices, aeq.indptr, model.b, model.b, model.array_f)
 
     friction_constraint = MatrixConstraint(
         afr.data,
         afr.indices,
         afr.indptr,
-        [None for i in range(afr.shape[0])],
+        [None] * afr.shape[0],
         zeros(afr.shape[0]),
         model.array_f,
     )
     return equilibrium_constraints, friction_constraint
 
 
+def virtual_displacement_constraints(model, aeq_t, d_bnd=1e-3, eps=1e-4) -> tuple:
+    r"""Create virtual displacement bound and no penetration constraints.
+
+    Both constraints are linear in :math:`\delta q`, so they are built directly from the sparse
+    rows of :math:`{\bf{A}}_{eq}^\intercal` instead of evaluating a pyomo rule per vertex.
+
+    Parameters
+    ----------
+    model : model
+        Pyomo model object, with the plain array of the q variables as ``model.array_q``.
+        The bound arrays are stored on the model as ``model.d_lb``, ``model.d_ub`` and ``model.dn_lb``.
+    aeq_t : :class:`~scipy.sparse.csr_matrix`
+        Transposed Aeq matrix in CSR format, :math:`\delta d = {\bf{A}}_{eq}^\intercal \delta q`.
+    d_bnd : float, optional
+        displacement bounds, -d_bnd <= d <= d_bnd
+    eps : float, optional
+        epsilon, overlapping parameter
+
+    Returns
+    -------
+    :class:`~pyomo.core.base.matrix_constraint.MatrixConstraint`, :class:`~pyomo.core.base.matrix_constraint.MatrixConstraint`
+        displacement bound and no penetration constraints, to be added to the model
+
+    """  # noqa: E501
+
+    aeq_tn = aeq_t[0::3, :]  # normal components δd_n
+    d_num = aeq_t.shape[0]
+    n_num = aeq_tn.shape[0]
+
+    # bounds, kept to be updated in place
+    model.d_lb = full(d_num, -d_bnd)
+    model.d_ub = full(d_num, d_bnd)
+    model.dn_lb = full(n_num, -eps)
+
+    bound_constraint = MatrixConstraint(
+        aeq_t.data,
+        aeq_t.indices,
+        aeq_t.indptr,
+        model.d_lb,
+        model.d_ub,
+        model.array_q,
+    )
+
+    no_penetration_constraint = MatrixConstraint(
+        aeq_tn.data,
+        aeq_tn.indices,
+        aeq_tn.indptr,
+        model.dn_lb,
+        [None] * n_num,
+        model.array_q,
+    )
+    return bound_constraint, no_penetration_constraint
+
+
+_MODELS = WeakKeyDictionary()
+
+
+def model_cache(assembly):
+    """Return the cache of pyomo models built for the assembly.
+
+    The models are kept outside the assembly, so that the assembly can still be pickled and copied.
+    Like :func:`setup_cache`, the cache is emptied whenever the geometry of the assembly changed.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_assembly.datastructures.Assembly`
+        The rigid block assembly.
+
+    Returns
+    -------
+    dict
+        The cached models of the current geometry.
+
+    """
+    key = setup_cache(assembly)["key"]
+    cache = _MODELS.get(assembly)
+    if cache is None or cache["key"] != key:
+        cache = {"key": key}
+        _MODELS[assembly] = cache
+    return cache
+
+
+def update_parameters(model, p, d_bnd=None, eps=None):
+    """Update the external force and bounds of a model in place.
+
+    The matrix constraints keep references to the bound arrays stored on the model,
+    so the new values are used the next time the model is solved, without rebuilding it.
+
+    Parameters
+    ----------
+    model : model
+        Pyomo model object, built with :func:`static_equilibrium_constraints`
+        and optionally :func:`virtual_displacement_constraints`.
+    p : :class:`~numpy.ndarray`
+        External force p.
+    d_bnd : float, optional
+        displacement bounds, -d_bnd <= d <= d_bnd
+    eps : float, optional
+        epsilon, overlapping parameter
+
+    Returns
+    -------
+    None
+
+    """
+    model.b[:] = -p.ravel()
+    if d_bnd is not None:
+        model.d_lb[:] = -d_bnd
+        model.d_ub[:] = d_bnd
+    if eps is not None:
+        model.dn_lb[:] = -eps
+        model.eps.value = eps
+
+
+def linear_expressions(a, x):
+    """Create the linear expressions of the sparse matrix-vector product a @ x.
+
+    Only the stored entries of each row are used, so no zero terms end up in the expressions.
+
+    Parameters
+    ----------
+    a : :class:`~scipy.sparse.csr_matrix`
+        Sparse coefficient matrix.
+    x : :class:`~numpy.ndarray`
+        Pyomo variables.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Object array of pyomo expressions, one per row of a.
+
+    """
+
+    a = a.tocsr()
+    expressions = empty(a.shape[0], dtype=object)
+    for i in range(a.shape[0]):
+        start, end = a.indptr[i], a.indptr[i + 1]
+        expressions[i] = LinearExpression(
+            constant=0.0,
+            linear_coefs=a.data[start:end].tolist(),
+            linear_vars=x[a.indices[start:end]].tolist(),
+        )
+    return expressions
+
+
+HSL_SOLVERS = ("ma27", "ma57", "ma77", "ma86", "ma97")
+
+
+@lru_cache(maxsize=None)
+def _hsl_library():
+    """Find the HSL library for IPOPT once, the lookup spawns subprocesses."""
+    return find_library("hsl") or find_library("coinhsl")
+
+
+def ipopt_solver(verbose=False, linear_solver=None, **options):
+    """Create an IPOPT solver with options suited to CRA problems.
+
+    Parameters
+    ----------
+    verbose : bool, optional
+        Print IPOPT iteration log, by default False.
+    linear_solver : str, optional
+        IPOPT linear solver, by default IPOPT's default.
+        For the HSL solvers, e.g. ``ma57``, ``hsllib`` is set to the HSL library found on the system,
+        and :func:`ipopt_solve` falls back to IPOPT's default if the HSL solver cannot be used.
+    **options
+        Additional IPOPT options, see https://coin-or.github.io/Ipopt/OPTIONS.html
+
+    Returns
+    -------
+    :class:`pyomo.opt.base.solvers.OptSolver`
+    """
+    solver = pyo.SolverFactory("ipopt")
+    solver.options["mu_strategy"] = "adaptive"
+    solver.options["print_level"] = 5 if verbose else 0
+    if linear_solver is not None:
+        solver.options["linear_solver"] = linear_solver
+        if linear_solver in HSL_SOLVERS and _hsl_library():
+            solver.options["hsllib"] = _hsl_library()
+    solver.options.update(options)
+    return solver
+
+
+def ipopt_solve(solver, model, tee=False):
+    """Solve a model with an IPOPT solver created by :func:`ipopt_solver`.
+
+    If the solve with an HSL linear solver fails, e.g. because the HSL library cannot be loaded,
+    the model is solved again with IPOPT's default linear solver.
+
+    Parameters
+    ----------
+    solver : :class:`pyomo.opt.base.solvers.OptSolver`
+        IPOPT solver.
+    model : model
+        Pyomo model object.
+    tee : bool, optional
+        Print the solver output, by default False.
+
+    Returns
+    -------
+    :class:`pyomo.opt.results.results_.SolverResults`
+    """
+    if solver.options.get("linear_solver") not in HSL_SOLVERS:
+        return solver.solve(model, tee=tee)
+
+    try:
+        result = solver.solve(model, tee=tee)
+    except ApplicationError:
+        result = None
+    if result is not None and result.solver.termination_condition not in (
+        pyo.TerminationCondition.error,
+        pyo.TerminationCondition.internalSolverError,
+    ):
+        return result
+
+    print("HSL linear solver %s failed, falling back to IPOPT's default" % solver.options["linear_solver"])
+    del solver.options["linear_solver"]
+    solver.options.pop("hsllib", None)
+    return solver.solve(model, tee=tee)
+
+
 def pyomo_result_check(result):
     """Check if pyomo optimisation result, raise error if the problem is infeasible."""
     if (
@@ -270,6 +506,23 @@ def pyomo_result_check(result):
     print("result: ", result.solver.termination_condition)
 
 
+def pyomo_result_contact(model, aeq, penalty=False):
+    """Print contact forces and normal virtual displacements of all vertices as one table."""
+
+    f = fromiter((v.value for v in model.array_f), dtype=float, count=len(model.array_f))
+    q = fromiter((v.value for v in model.array_q), dtype=float, count=len(model.array_q))
+    d = aeq.T @ q
+    dn = d[0::3]
+    if penalty:
+        fn = f[0::4] - f[1::4]
+        table = column_stack((f[0::4], f[1::4], f[2::4], f[3::4], dn, fn * dn))
+        header = "fn+ fn- fu fv dn fn*dn"
+    else:
+        table = column_stack((f[0::3], f[1::3], f[2::3], dn, f[0::3] * dn))
+        header = "fn fu fv dn fn*dn"
+    savetxt(sys.stdout, table, fmt="%.6g", header=header)
+
+
 def pyomo_result_assembly(model, assembly, penalty=False, verbose=False):
     """Save pyomo optimisation results to assembly."""
 
@@ -277,27 +530,28 @@ def pyomo_result_assembly(model, assembly, penalty=False, verbose=False):
     if penalty:
         shift = 4  # for cra_penalty and rbe shift number is 4
 
-    # save force to assembly
+    # save force to assembly, one row of f per vertex
+    f = fromiter((v.value for v in model.f.values()), dtype=float, count=len(model.f))
+    f = f.reshape((-1, shift)).tolist()
     offset = 0
     for edge in assembly.graph.edges():
         interfaces = assembly.graph.edge_attribute(edge, "interfaces")
         for interface in interfaces:
-            interface.forces = []
             n = len(interface.points)
-            for i in range(n):
-                interface.forces.append(
-                    {
-                        "c_np": model.f[offset + shift * i + 0].value,
-                        "c_nn": model.f[offset + shift * i + 1].value if penalty else 0,
-                        "c_u": model.f[offset + shift * i + 1 + (1 if penalty else 0)].value,
-                        "c_v": model.f[offset + shift * i + 2 + (1 if penalty else 0)].value,
-                    }
-                )
-            offset += shift * n
+            interface.forces = [
+                {
+                    "c_np": f_i[0],
+                    "c_nn": f_i[1] if penalty else 0,
+                    "c_u": f_i[-2],
+                    "c_v": f_i[-1],
+                }
+                for f_i in f[offset : offset + n]
+            ]
+            offset += n
 
     # save displacement to assembly
     if model.find_component("q") is not None:
-        q = [model.q[i].value for i in range(len(model.q))]
+        q = [v.value for v in model.q.values()]
         if verbose:
             print("q:", q)
         offset = 0
@@ -11,10 +11,14 @@ from .cra_helper import external_force_setup
 from .cra_helper import friction_setup
 from .cra_helper import num_vertices
 from .pyomo_helper import bounds
+from .pyomo_helper import ipopt_solve
+from .pyomo_helper import ipopt_solver
+from .pyomo_helper import model_cache
 from .pyomo_helper import objectives
 from .pyomo_helper import pyomo_result_assembly
 from .pyomo_helper import pyomo_result_check
 from .pyomo_helper import static_equilibrium_constraints
+from .pyomo_helper import update_parameters
 
 
 def rbe_solve(
@@ -23,6 +27,8 @@ def rbe_solve(
     density: float = 1.0,
     verbose: bool = False,
     timer: bool = False,
+    warm_start: bool = False,
+    linear_solver: str = None,
 ) -> Assembly:
     r"""RBE solver with penalty formulation using Pyomo + IPOPT.
 
@@ -38,6 +44,10 @@ def rbe_solve(
         Print information during the execution of the algorithm.
     timer : bool, optional
         Time the solving time.
+    warm_start : bool, optional
+        Start from the solution of the previous solve of the same assembly.
+    linear_solver : str, optional
+        IPOPT linear solver, e.g. ``ma57`` if the HSL library is installed, by default IPOPT's default.
 
     Returns
     -------
@@ -65,27 +75,20 @@ def rbe_solve(
 
     """
 
-    model = pyo.ConcreteModel()
-
     if timer:
         start_time = time.time()
 
-    v_num = num_vertices(assembly)  # number of vertices
-
-    model.f_id = pyo.Set(initialize=range(v_num * 4))  # force indices
-    model.f = pyo.Var(model.f_id, initialize=0, domain=bounds("f_tilde"))
-    model.array_f = np.array([model.f[i] for i in model.f_id])
-
-    aeq_b = equilibrium_setup(assembly, penalty=True)
-    afr_b = friction_setup(assembly, mu, penalty=True)
     p = external_force_setup(assembly, density)
 
-    obj_rbe = objectives("rbe", (0, 1e0, 1e6, 1e0))
-    eq_con, fr_con = static_equilibrium_constraints(model, aeq_b, afr_b, p)
-
-    model.obj = pyo.Objective(rule=obj_rbe, sense=pyo.minimize)
-    model.ceq = eq_con
-    model.cfr = fr_con
+    cache = model_cache(assembly)
+    cached_mu, model = cache.get("rbe_model", (None, None))
+    if model is None or cached_mu != mu:
+        model = _rbe_model(assembly, mu, p)
+        cache["rbe_model"] = (mu, model)  # one model per assembly, replaced when mu changes
+    else:
+        update_parameters(model, p)
+        if not warm_start:
+            model.f.set_values(dict.fromkeys(model.f_id, 0))
 
     if timer:
         print("--- set up time: %s seconds ---" % (time.time() - start_time))
@@ -93,8 +96,11 @@ def rbe_solve(
     if timer:
         start_time = time.time()
 
-    solver = pyo.SolverFactory("ipopt")
-    result = solver.solve(model, tee=verbose)
+    solver = ipopt_solver(verbose, linear_solver)
+    solver.options["jac_c_constant"] = "yes"  # equilibrium constraints are linear
+    solver.options["jac_d_constant"] = "yes"  # friction constraints are linear
+    solver.options["hessian_constant"] = "yes"  # quadratic objective
+    result = ipopt_solve(solver, model, tee=verbose)
 
     if timer:
         print("--- solving time: %s seconds ---" % (time.time() - start_time))
@@ -108,3 +114,26 @@ def rbe_solve(
     pyomo_result_assembly(model, assembly, penalty=True, verbose=verbose)
 
     return assembly
+
+
+def _rbe_model(assembly, mu, p):
+    """Build the pyomo model of the RBE problem, the model only depends on the geometry and mu."""
+    model = pyo.ConcreteModel()
+
+    v_num = num_vertices(assembly)  # number of vertices
+
+    model.f_id = pyo.Set(initialize=range(v_num * 4))  # force indices
+    model.f = pyo.Var(model.f_id, initialize=0, domain=bounds("f_tilde"))
+    model.array_f = np.fromiter(model.f.values(), dtype=object, count=len(model.f_id))
+
+    aeq_b = equilibrium_setup(assembly, penalty=True)
+    afr_b = friction_setup(assembly, mu, penalty=True)
+
+    obj_rbe = objectives("rbe", (0, 1e0, 1e6, 1e0))
+    eq_con, fr_con = static_equilibrium_constraints(model, aeq_b, afr_b, p)
+
+    model.obj = pyo.Objective(rule=obj_rbe, sense=pyo.minimize)
+    model.ceq = eq_con
+    model.cfr = fr_con
+
+    return model
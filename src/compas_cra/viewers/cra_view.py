@@ -1,7 +1,5 @@
 """CRA view style using compas_viewer"""
 
-from math import sqrt
-
 import numpy as np
 from compas.colors import Color
 from compas.datastructures import Mesh
@@ -12,7 +10,6 @@ from compas.geometry import Polyline
 from compas.geometry import Rotation
 from compas.geometry import Translation
 from compas.geometry import Vector
-from compas.geometry import is_coplanar
 from compas_viewer import Viewer
 from compas_viewer.config import Config
 
@@ -20,8 +17,8 @@ from compas_viewer.config import Config
 class Arrow:
     def __init__(self, position=[0, 0, 0], direction=[0, 0, 1], linewidth=0.02):
         super().__init__()
-        self.position = Vector(*position)
-        self.direction = Vector(*direction)
+        self.position = np.asarray(position, dtype=float)
+        self.direction = np.asarray(direction, dtype=float)
         self.linewidth = linewidth
 
     def add_to_scene(self, viewer, facecolor: Color, opacity=1):
@@ -35,35 +32,155 @@ class Arrow:
             opacity=opacity,
         )
 
+    @staticmethod
+    def batch_add(arrows, viewer, facecolor: Color, opacity=1):
+        """Add arrows of one colour to the viewer in a single scene group.
+
+        The anchor and line width of every arrow are passed as per-item settings of the group.
+        """
+        if len(arrows) == 0:
+            return
+        viewer.scene.add(
+            [
+                (Vector(*arrow.direction), {"anchor": Point(*arrow.position), "linewidth": arrow.linewidth})
+                for arrow in arrows
+            ],
+            facecolor=facecolor,
+            linecolor=facecolor,
+            show_lines=True,
+            opacity=opacity,
+        )
+
+
+# columns of the interface force array, in the order of FORCE_KEYS
+FORCE_KEYS = ("c_np", "c_nn", "c_u", "c_v")
+C_NP, C_NN, C_U, C_V = range(len(FORCE_KEYS))
+
+
+def _forces_np(interface):
+    """Forces of the interface corners as an (N, 4) array with the columns C_NP, C_NN, C_U and C_V.
 
-def draw_blocks(assembly, viewer, edge=True, tol=0.0):
+    ``interface.forces`` stays the list of dicts that is serialised with the assembly,
+    this array is the column-wise copy used by the draw functions.
+    It is cached on the interface together with the force list it was built from,
+    so the draw functions share it and a new solution (a new list) invalidates it.
+    """
+    forces = interface.forces
+    cached = getattr(interface, "_cached_forces_np", None)
+    if cached is not None and cached[0] is forces:
+        return cached[1]
+    count = len(forces)
+    array = np.fromiter(
+        (force[key] for force in forces for key in FORCE_KEYS), dtype=float, count=len(FORCE_KEYS) * count
+    ).reshape((count, len(FORCE_KEYS)))
+    interface._cached_forces_np = (forces, array)
+    return array
+
+
+def _forces_to_arrays(interface):
+    """Normal, u and v force components of the interface corners and their totals."""
+    array = _forces_np(interface)
+    sums = array.sum(axis=0)
+    return (
+        array[:, C_NP] - array[:, C_NN],
+        array[:, C_U],
+        array[:, C_V],
+        np.array([sums[C_NP] - sums[C_NN], sums[C_U], sums[C_V]]),
+    )
+
+
+def _centroid(corners, weights):
+    """Weighted centroid of the interface corners."""
+    return weights @ corners / weights.sum()
+
+
+def _snapshot(graph):
+    """Nodes, edges and the attributes the draw functions need, looked up once and shared by them.
+
+    Returns
+    -------
+    tuple
+        The nodes, the edges, the "is_support", "block" and "displacement" attributes per node,
+        and the "interface" and "interfaces" attributes per edge.
+    """
+    nodes = tuple(graph.nodes())
+    edges = tuple(graph.edges())
+    node_attrs = {
+        node: {
+            "is_support": bool(graph.node_attribute(node, "is_support")),
+            "block": graph.node_attribute(node, "block"),
+            "displacement": graph.node_attribute(node, "displacement"),
+        }
+        for node in nodes
+    }
+    edge_attrs = {
+        edge: {
+            "interface": graph.edge_attribute(edge, "interface"),
+            "interfaces": graph.edge_attribute(edge, "interfaces"),
+        }
+        for edge in edges
+    }
+    return nodes, edges, node_attrs, edge_attrs
+
+
+def _edge_segments(block):
+    """Edges of a block and the coordinates of their end points as an (M, 2, 3) array."""
+    vertex_index = block.vertex_index()
+    edges = list(block.edges())
+    xyz = np.array(block.vertices_attributes("xyz"), dtype=float)
+    index = np.fromiter(
+        (vertex_index[vertex] for edge in edges for vertex in edge), dtype=int, count=2 * len(edges)
+    ).reshape((-1, 2))
+    return edges, xyz[index]
+
+
+def _coplanar_mask(block, edges, segments, tol):
+    """Mask of the edges between two coplanar faces, these edges are not drawn.
+
+    Same test as :func:`compas.geometry.is_coplanar` on the two face centres and the edge end points,
+    evaluated for all edges of the block at once.
+    """
+    faces = list(block.faces())
+    face_index = {face: index for index, face in enumerate(faces)}
+    centers = np.array([block.face_center(face) for face in faces], dtype=float)
+    pairs = np.fromiter(
+        (face_index[face] for edge in edges for face in block.edge_faces(edge)), dtype=int, count=2 * len(edges)
+    ).reshape((-1, 2))
+    a = centers[pairs[:, 0]]
+    det = np.einsum("ij,ij->i", np.cross(centers[pairs[:, 1]] - a, segments[:, 0] - a), segments[:, 1] - a)
+    return np.abs(det) <= tol
+
+
+def _lines(segments):
+    """Line objects of a list of (M, 2, 3) segment arrays, created in one pass when they are added to the scene."""
+    if len(segments) == 0:
+        return []
+    segments = np.concatenate(segments)
+    return list(map(Line, segments[:, 0].tolist(), segments[:, 1].tolist()))
+
+
+def draw_blocks(assembly, viewer, edge=True, tol=0.0, snapshot=None):
+    nodes, _, node_attrs, _ = snapshot or _snapshot(assembly.graph)
     supports = []
     blocks = []
     supportedges = []
     blockedges = []
-    for node in assembly.graph.nodes():
-        block = assembly.graph.node_attribute(node, "block")
-        if assembly.graph.node_attribute(node, "is_support"):
+    for node in nodes:
+        is_support = node_attrs[node]["is_support"]
+        block = node_attrs[node]["block"]
+        if is_support:
             supports.append(block)
         else:
             blocks.append(block)
         if not edge:
             continue
-        for edge in block.edges():
-            if tol != 0.0:
-                fkeys = block.edge_faces(edge)
-                ps = [
-                    block.face_center(fkeys[0]),
-                    block.face_center(fkeys[1]),
-                    *block.edge_coordinates(edge),
-                ]
-
-                if is_coplanar(ps, tol=tol):
-                    continue
-            if assembly.graph.node_attribute(node, "is_support"):
-                supportedges.append(Line(*block.edge_coordinates(edge)))
-            else:
-                blockedges.append(Line(*block.edge_coordinates(edge)))
+        edges, segments = _edge_segments(block)
+        if tol != 0.0:
+            segments = segments[~_coplanar_mask(block, edges, segments, tol)]
+        if is_support:
+            supportedges.append(segments)
+        else:
+            blockedges.append(segments)
     if len(blocks) != 0:
         viewer.scene.add(
             blocks,
@@ -80,31 +197,36 @@ def draw_blocks(assembly, viewer, edge=True, tol=0.0):
             opacity=0.5,
             facecolor=Color.from_hex("#f79d84"),
         )
+    blockedges = _lines(blockedges)
+    supportedges = _lines(supportedges)
     if len(blockedges) != 0:
         viewer.scene.add(blockedges, linewidth=1.5)
     if len(supportedges) != 0:
         viewer.scene.add(supportedges, linecolor=Color.from_hex("#f79d84"), linewidth=4)
 
 
-def draw_interfaces(assembly, viewer):
+def _closed_polyline(points):
+    """Closed outline of an interface, Polyline copies the corners so no intermediate array is needed."""
+    return Polyline(points + points[:1])
+
+
+def draw_interfaces(assembly, viewer, snapshot=None):
+    _, edges, node_attrs, edge_attrs = snapshot or _snapshot(assembly.graph)
     interfaces = []
     faces = []
-    for edge in assembly.graph.edges():
-        interface = assembly.graph.edge_attribute(edge, "interface")
+    for edge in edges:
+        interface = edge_attrs[edge]["interface"]
         if interface is not None:
-            corners = np.array(interface.points)
-            faces.append(Polyline(np.vstack((corners, corners[0]))))
-            if assembly.graph.node_attribute(edge[0], "is_support") or assembly.graph.node_attribute(
-                edge[1], "is_support"
-            ):
+            faces.append(_closed_polyline(interface.points))
+            if node_attrs[edge[0]]["is_support"] or node_attrs[edge[1]]["is_support"]:
                 continue
             polygon = Polygon(interface.points)
             interfaces.append(Mesh.from_polygons([polygon]))
-        if assembly.graph.edge_attribute(edge, "interfaces") is None:
+        subinterfaces = edge_attrs[edge]["interfaces"]
+        if subinterfaces is None:
             continue
-        for subinterface in assembly.graph.edge_attribute(edge, "interfaces"):
-            corners = np.array(subinterface.points)
-            faces.append(Polyline(np.vstack((corners, corners[0]))))
+        for subinterface in subinterfaces:
+            faces.append(_closed_polyline(subinterface.points))
             polygon = Polygon(subinterface.points)
             interfaces.append(Mesh.from_polygons([polygon]))
 
@@ -126,63 +248,105 @@ def draw_interfaces(assembly, viewer):
         )
 
 
-def draw_forces(assembly, viewer, scale=1.0, resultant=True, nodal=False):
-    locs = []
-    res_np = []
-    res_nn = []
-    fnp = []
-    fnn = []
-    ft = []
-    for edge in assembly.graph.edges():
-        interface = assembly.graph.edge_attribute(edge, "interface")
-        if interface is None:
-            break
-        forces = interface.forces
-        if forces is None:
-            continue
-        corners = np.array(interface.points)
-        frame = interface.frame
-        w, u, v = frame.zaxis, frame.xaxis, frame.yaxis
-        if nodal:
-            for i, corner in enumerate(corners):
-                pt = Point(*corner)
-                force = forces[i]["c_np"] - forces[i]["c_nn"]
-                p1 = pt + w * force * 0.5 * scale
-                p2 = pt - w * force * 0.5 * scale
-                if force >= 0:
-                    fnn.append(Line(p1, p2))
-                else:
-                    fnp.append(Line(p1, p2))
-                ft_uv = (u * forces[i]["c_u"] + v * forces[i]["c_v"]) * 0.5 * scale
-                p1 = pt + ft_uv
-                p2 = pt - ft_uv
-                ft.append(Line(p1, p2))
-        if resultant:
-            sum_n = sum(force["c_np"] - force["c_nn"] for force in forces)
-            sum_u = sum(force["c_u"] for force in forces)
-            sum_v = sum(force["c_v"] for force in forces)
-            if sum_n == 0:
-                continue
-            resultant_pos = np.average(
-                np.array(corners),
-                axis=0,
-                weights=[force["c_np"] - force["c_nn"] for force in forces],
-            )
-            locs.append(Point(*resultant_pos))
-            # resultant
-            resultant_f = (w * sum_n + u * sum_u + v * sum_v) * 0.5 * scale
-            p1 = resultant_pos + resultant_f
-            p2 = resultant_pos - resultant_f
-            if sum_n >= 0:
-                res_np.append(Line(p1, p2))
-            else:
-                res_nn.append(Line(p1, p2))
-    if len(locs) != 0:
-        viewer.scene.add(locs, size=12, color=Color.from_hex("#386641"))
-    if len(res_np) != 0:
-        viewer.scene.add(res_np, linewidth=8, linecolor=Color(0, 0.3, 0))
-    if len(res_nn) != 0:
-        viewer.scene.add(res_nn, linewidth=8, linecolor=Color(0.8, 0, 0))
+def _interface_forces(interface):
+    """Corners, force components, force totals and frame axes of an interface, shared by all force views.
+
+    The frame axes are the rows w, u, v of a (3, 3) array, so the resultant force is ``sums @ wuv``.
+    """
+    fn, fu, fv, sums = _forces_to_arrays(interface)
+    frame = interface.frame
+    wuv = np.array([frame.zaxis, frame.xaxis, frame.yaxis], dtype=float)
+    return np.array(interface.points, dtype=float), fn, fu, fv, sums, wuv
+
+
+def _collect_lines(data, scale, resultant, nodal, lists, legacy):
+    """Append the nodal and resultant force lines of one interface, see :func:`draw_forces`."""
+    corners, fn, fu, fv, sums, wuv = data
+    sum_n = sums[0]
+    w, u, v = wuv
+    if nodal:
+        f_n = np.multiply.outer(fn, w) * (0.5 * scale)
+        f_t = (np.multiply.outer(fu, u) + np.multiply.outer(fv, v)) * (0.5 * scale)
+        p1 = corners + f_n
+        p2 = corners - f_n
+        compression = fn >= 0
+        segments = np.stack((p1, p2), axis=1)
+        lists["fnn"].append(segments[compression])
+        lists["fnp"].append(segments[~compression])
+        lists["ft"].append(np.stack((corners + f_t, corners - f_t), axis=1))
+    if not resultant or sum_n == 0:
+        return
+    if legacy:
+        is_tension = sum_n < 0
+    else:
+        is_tension = bool(np.any(fn <= -1e-5))
+    resultant_pos = _centroid(corners, fn)
+    lists["locs"].append(Point(*resultant_pos))
+    resultant_f = sums @ wuv * (0.5 * scale)
+    p1 = resultant_pos + resultant_f
+    p2 = resultant_pos - resultant_f
+    if not is_tension:
+        lists["res_np"].append(Line(p1, p2))
+    else:
+        lists["res_nn"].append(Line(p1, p2))
+
+
+def _collect_arrows(data, flip, scale, resultant, nodal, lists):
+    """Append the nodal and resultant force arrows of one interface, see :func:`draw_forcesdirect`."""
+    thres = 1e-6
+    corners, fn, fu, fv, sums, wuv = data
+    sum_n = sums[0]
+    w, u, v = wuv
+    sign = -scale if flip else scale
+    if nodal:
+        f_n = np.multiply.outer(fn, w) * sign
+        f_t = (np.multiply.outer(fu, u) + np.multiply.outer(fv, v)) * sign
+        # w, u and v are unit axes, so the force lengths are zero exactly when these scalars are
+        has_n = fn * sign != 0  # corners without normal force draw nothing
+        has_t = has_n & ((fu * fu + fv * fv) * sign != 0)
+        compression = has_n & (fn >= 0)
+        tension = has_n & (fn < 0)
+        lists["fnp"].extend(Arrow(p, f, linewidth=10) for p, f in zip(corners[compression], f_n[compression]))
+        lists["fnn"].extend(Arrow(p, f, linewidth=10) for p, f in zip(corners[tension], f_n[tension]))
+        lists["ft"].extend(Arrow(p, f, linewidth=10) for p, f in zip(corners[has_t], f_t[has_t]))
+    if not resultant:
+        return
+    is_tension = bool(np.any(fn <= -1e-5))
+    if abs(sum_n) <= thres:
+        weights = np.hypot(fu, fv)
+        if not weights.any():
+            return  # no force on this interface
+        friction = True
+    else:
+        weights = fn
+        friction = False
+    resultant_pos = _centroid(corners, weights)
+    resultant_f = sums @ wuv * sign
+    if resultant_f @ resultant_f >= thres * thres:
+        lists["locs"].append(Point(*resultant_pos))
+    f = Arrow(resultant_pos, resultant_f, linewidth=10)
+    if friction:
+        lists["friction"].append(f)
+    if not is_tension:
+        lists["res_np"].append(f)
+    else:
+        lists["res_nn"].append(f)
+
+
+def _add_lines(viewer, lists, legacy):
+    """Add the force lines collected by :func:`_collect_lines` to the viewer."""
+    if len(lists["locs"]) != 0:
+        if legacy:
+            viewer.scene.add(lists["locs"], size=12, color=Color.from_hex("#386641"))
+        else:
+            viewer.scene.add(lists["locs"], pointsize=12, pointcolor=Color.from_hex("#386641"))
+    if len(lists["res_np"]) != 0:
+        viewer.scene.add(lists["res_np"], linewidth=8, linecolor=Color(0, 0.3, 0))
+    if len(lists["res_nn"]) != 0:
+        viewer.scene.add(lists["res_nn"], linewidth=8, linecolor=Color(0.8, 0, 0))
+    fnn = _lines(lists["fnn"])
+    fnp = _lines(lists["fnp"])
+    ft = _lines(lists["ft"])
     if len(fnn) != 0:
         viewer.scene.add(fnn, linewidth=5, linecolor=Color.from_hex("#00468b"))
     if len(fnp) != 0:
@@ -191,253 +355,155 @@ def draw_forces(assembly, viewer, scale=1.0, resultant=True, nodal=False):
         viewer.scene.add(ft, linewidth=5, linecolor=Color(1.0, 0.5, 0.0))
 
 
-def draw_forcesline(assembly, viewer, scale=1.0, resultant=True, nodal=False):
-    locs = []
-    res_np = []
-    res_nn = []
-    fnp = []
-    fnn = []
-    ft = []
-    # total_reaction = 0
-    for edge in assembly.graph.edges():
-        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
-            forces = interface.forces
-            if forces is None:
-                continue
-            corners = np.array(interface.points)
-            frame = interface.frame
-            w, u, v = frame.zaxis, frame.xaxis, frame.yaxis
-            if nodal:
-                for i, corner in enumerate(corners):
-                    pt = Point(*corner)
-                    force = forces[i]["c_np"] - forces[i]["c_nn"]
-                    p1 = pt + w * force * 0.5 * scale
-                    p2 = pt - w * force * 0.5 * scale
-                    if force >= 0:
-                        fnn.append(Line(p1, p2))
-                    else:
-                        fnp.append(Line(p1, p2))
-                    ft_uv = (u * forces[i]["c_u"] + v * forces[i]["c_v"]) * 0.5 * scale
-                    p1 = pt + ft_uv
-                    p2 = pt - ft_uv
-                    ft.append(Line(p1, p2))
-            if resultant:
-                is_tension = False
-                for force in forces:
-                    if force["c_np"] - force["c_nn"] <= -1e-5:
-                        is_tension = True
-
-                sum_n = sum(force["c_np"] - force["c_nn"] for force in forces)
-                sum_u = sum(force["c_u"] for force in forces)
-                sum_v = sum(force["c_v"] for force in forces)
-                if sum_n == 0:
-                    continue
-                resultant_pos = np.average(
-                    np.array(corners),
-                    axis=0,
-                    weights=[force["c_np"] - force["c_nn"] for force in forces],
-                )
-                locs.append(Point(*resultant_pos))
-                # resultant
-                resultant_f = (w * sum_n + u * sum_u + v * sum_v) * 0.5 * scale
-                # print((w * sum_n + u * sum_u + v * sum_v).length * 100000, "edge: ", edge)
-
-                # if assembly.graph.node_attribute(edge[0], "is_support") or assembly.graph.node_attribute(
-                #     edge[1], "is_support"
-                # ):
-                #     print((w * sum_n + u * sum_u + v * sum_v).z)
-                # total_reaction += abs((w * sum_n + u * sum_u + v * sum_v).z * 100000)
-
-                p1 = resultant_pos + resultant_f
-                p2 = resultant_pos - resultant_f
-
-                if not is_tension:
-                    res_np.append(Line(p1, p2))
-                else:
-                    res_nn.append(Line(p1, p2))
-    if len(locs) != 0:
-        viewer.scene.add(locs, pointsize=12, pointcolor=Color.from_hex("#386641"))
-    if len(res_np) != 0:
-        viewer.scene.add(res_np, linewidth=8, linecolor=Color(0, 0.3, 0))
-    if len(res_nn) != 0:
-        viewer.scene.add(res_nn, linewidth=8, linecolor=Color(0.8, 0, 0))
-    if len(fnn) != 0:
-        viewer.scene.add(fnn, linewidth=5, linecolor=Color.from_hex("#00468b"))
-    if len(fnp) != 0:
-        viewer.scene.add(fnp, linewidth=5, linecolor=Color(1, 0, 0))
-    if len(ft) != 0:
-        viewer.scene.add(ft, linewidth=5, linecolor=Color(1.0, 0.5, 0.0))
-    # print("total reaction: ", total_reaction)
-
-
-def draw_forcesdirect(assembly, viewer, scale=1.0, resultant=True, nodal=False):
-    locs = []
-    res_np = []
-    res_nn = []
-    fnp = []
-    fnn = []
-    ft = []
-    for edge in assembly.graph.edges():
-        thres = 1e-6
-        if assembly.graph.node_attribute(edge[0], "is_support") and not assembly.graph.node_attribute(
-            edge[1], "is_support"
-        ):
-            flip = False
-        else:
-            flip = True
-        if assembly.graph.edge_attribute(edge, "interfaces") is None:
-            continue
-        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
-            forces = interface.forces
-            if forces is None:
-                continue
-            corners = np.array(interface.points)
-            frame = interface.frame
-            w, u, v = frame.zaxis, frame.xaxis, frame.yaxis
-            if nodal:
-                for i, corner in enumerate(corners):
-                    pt = Point(*corner)
-                    force = forces[i]["c_np"] - forces[i]["c_nn"]
-                    if (w * force * scale).length == 0:
-                        continue
-                    if flip:
-                        f = Arrow(pt, w * force * scale * -1, linewidth=10)
-                    else:
-                        f = Arrow(pt, w * force * scale, linewidth=10)
-                    if force >= 0:
-                        fnp.append(f)
-                    else:
-                        fnn.append(f)
-                    ft_uv = (u * forces[i]["c_u"] + v * forces[i]["c_v"]) * scale
-                    if ft_uv.length == 0:
-                        continue
-                    if flip:
-                        f = Arrow(
-                            pt,
-                            ft_uv * -1,
-                            linewidth=10,
-                        )
-                    else:
-                        f = Arrow(
-                            pt,
-                            ft_uv,
-                            linewidth=10,
-                        )
-                    ft.append(f)
-            if resultant:
-                is_tension = False
-
-                for force in forces:
-                    if force["c_np"] - force["c_nn"] <= -1e-5:
-                        is_tension = True
-
-                sum_n = sum(force["c_np"] - force["c_nn"] for force in forces)
-                sum_u = sum(force["c_u"] for force in forces)
-                sum_v = sum(force["c_v"] for force in forces)
-                if abs(sum_n) <= thres:
-                    resultant_pos = np.average(
-                        np.array(corners),
-                        axis=0,
-                        weights=[sqrt(force["c_u"] ** 2 + force["c_v"] ** 2) for force in forces],
-                    )
-                    friction = True
-                else:
-                    resultant_pos = np.average(
-                        np.array(corners),
-                        axis=0,
-                        weights=[force["c_np"] - force["c_nn"] for force in forces],
-                    )
-                    friction = False
-                resultant_f = (w * sum_n + u * sum_u + v * sum_v) * scale
-                if resultant_f.length >= thres:
-                    locs.append(Point(*resultant_pos))
-                if flip:
-                    f = Arrow(resultant_pos, resultant_f * -1, linewidth=10)
-                else:
-                    f = Arrow(resultant_pos, resultant_f, linewidth=10)
-                if friction:
-                    f.add_to_scene(viewer, facecolor=(1.0, 0.5, 0.0))
-                if not is_tension:
-                    res_np.append(f)
-                else:
-                    res_nn.append(f)
-    if len(locs) != 0:
-        viewer.scene.add(locs, size=12, color=Color.from_hex("#386641"))
-    if len(res_np) != 0:
-        for arrow in res_np:
-            arrow.add_to_scene(viewer, facecolor=Color.from_hex("#386641"))
-    if len(res_nn) != 0:
-        for arrow in res_nn:
-            arrow.add_to_scene(viewer, facecolor=Color(0.8, 0, 0))
-    if len(fnp) != 0:
-        for arrow in fnp:
-            arrow.add_to_scene(viewer, facecolor=Color.from_hex("#00468b"), opacity=0.5)
-    if len(fnn) != 0:
-        for arrow in fnn:
-            arrow.add_to_scene(viewer, facecolor=Color(1, 0, 0), opacity=0.5)
-    if len(ft) != 0:
-        for arrow in ft:
-            arrow.add_to_scene(viewer, facecolor=Color(1.0, 0.5, 0.0), opacity=0.5)
+def _add_arrows(viewer, lists):
+    """Add the force arrows collected by :func:`_collect_arrows` to the viewer."""
+    Arrow.batch_add(lists["friction"], viewer, facecolor=(1.0, 0.5, 0.0))
+    if len(lists["locs"]) != 0:
+        viewer.scene.add(lists["locs"], size=12, color=Color.from_hex("#386641"))
+    Arrow.batch_add(lists["res_np"], viewer, facecolor=Color.from_hex("#386641"))
+    Arrow.batch_add(lists["res_nn"], viewer, facecolor=Color(0.8, 0, 0))
+    Arrow.batch_add(lists["fnp"], viewer, facecolor=Color.from_hex("#00468b"), opacity=0.5)
+    Arrow.batch_add(lists["fnn"], viewer, facecolor=Color(1, 0, 0), opacity=0.5)
+    Arrow.batch_add(lists["ft"], viewer, facecolor=Color(1.0, 0.5, 0.0), opacity=0.5)
 
 
-def draw_displacements(assembly, viewer, dispscale=1.0, tol=0.0):
+def _edge_interfaces(edge_attrs, edges):
+    """Interfaces with forces stored in the "interface" attribute of the edges."""
+    interfaces = (edge_attrs[edge]["interface"] for edge in edges)
+    return [interface for interface in interfaces if interface is not None and interface.forces is not None]
+
+
+def _edge_subinterfaces(edge_attrs, edges):
+    """Pairs of edge and sub-interface with forces stored in the "interfaces" attribute of the edges."""
+    return [
+        (edge, interface)
+        for edge in edges
+        for interface in edge_attrs[edge]["interfaces"] or ()
+        if interface.forces is not None
+    ]
+
+
+def _draw_all_forces(assembly, viewer, scale=1.0, resultant=True, nodal=False, modes=("legacy",), snapshot=None):
+    """Draw the contact forces of several force views in a single traversal of the assembly graph.
+
+    Parameters
+    ----------
+    assembly : :class:`~compas_assembly.datastructures.Assembly`
+        The rigid block assembly.
+    viewer : compas_viewer.Viewer
+        The viewer to draw in.
+    scale : float, optional
+        Force scale.
+    resultant : bool, optional
+        Plot resultant forces.
+    nodal : bool, optional
+        Plot nodal forces.
+    modes : collection[str], optional
+        The force views to draw: "legacy" (:func:`draw_forces`), "direct" (:func:`draw_forcesdirect`)
+        and "line" (:func:`draw_forcesline`).
+    snapshot : tuple, optional
+        Nodes, edges and their attributes, see :func:`_snapshot`.
+
+    Returns
+    -------
+    None
+    """
+    legacy = "legacy" in modes
+    direct = "direct" in modes
+    line = "line" in modes
+    _, edges, node_attrs, edge_attrs = snapshot or _snapshot(assembly.graph)
+    keys = ("locs", "res_np", "res_nn", "fnp", "fnn", "ft", "friction")
+    lists = {mode: {key: [] for key in keys} for mode in ("legacy", "direct", "line")}
+    if legacy:
+        for interface in _edge_interfaces(edge_attrs, edges):
+            _collect_lines(_interface_forces(interface), scale, resultant, nodal, lists["legacy"], True)
+    if direct or line:
+        for edge, interface in _edge_subinterfaces(edge_attrs, edges):
+            data = _interface_forces(interface)
+            if direct:
+                flip = not (node_attrs[edge[0]]["is_support"] and not node_attrs[edge[1]]["is_support"])
+                _collect_arrows(data, flip, scale, resultant, nodal, lists["direct"])
+            if line:
+                _collect_lines(data, scale, resultant, nodal, lists["line"], False)
+    if legacy:
+        _add_lines(viewer, lists["legacy"], True)
+    if direct:
+        _add_arrows(viewer, lists["direct"])
+    if line:
+        _add_lines(viewer, lists["line"], False)
+
+
+def draw_forces(assembly, viewer, scale=1.0, resultant=True, nodal=False, snapshot=None):
+    _draw_all_forces(assembly, viewer, scale, resultant, nodal, modes=("legacy",), snapshot=snapshot)
+
+
+def draw_forcesline(assembly, viewer, scale=1.0, resultant=True, nodal=False, snapshot=None):
+    _draw_all_forces(assembly, viewer, scale, resultant, nodal, modes=("line",), snapshot=snapshot)
+
+
+def draw_forcesdirect(assembly, viewer, scale=1.0, resultant=True, nodal=False, snapshot=None):
+    _draw_all_forces(assembly, viewer, scale, resultant, nodal, modes=("direct",), snapshot=snapshot)
+
+
+def draw_displacements(assembly, viewer, dispscale=1.0, tol=0.0, snapshot=None):
+    graph_nodes, _, node_attrs, _ = snapshot or _snapshot(assembly.graph)
     blocks = []
     nodes = []
-    for node in assembly.graph.nodes():
-        if assembly.graph.node_attribute(node, "is_support"):
-            continue
-        block = assembly.graph.node_attribute(node, "block")
-        displacement = assembly.graph.node_attribute(node, "displacement")
-        if displacement is None:
+    for node in graph_nodes:
+        attrs = node_attrs[node]
+        displacement = attrs["displacement"]
+        if attrs["is_support"] or displacement is None:
             continue
+        block = attrs["block"]
         displacement = np.array(displacement) * dispscale
         vec = (
             np.array([1, 0, 0]) * displacement[3]
             + np.array([0, 1, 0]) * displacement[4]
             + np.array([0, 0, 1]) * displacement[5]
         ).tolist()
-        R = Rotation.from_axis_angle_vector(vec, point=block.center())
+        center = block.center()
+        R = Rotation.from_axis_angle_vector(vec, point=center)
         T = Translation.from_vector(displacement[0:3])
-        new_block = block.transformed(R).transformed(T)
-        nodes.append(Point(*new_block.center()))
-        for edge in block.edges():
-            if tol != 0.0:
-                fkeys = block.edge_faces(edge)
-                ps = [
-                    block.face_center(fkeys[0]),
-                    block.face_center(fkeys[1]),
-                    *block.edge_coordinates(edge),
-                ]
-                if is_coplanar(ps, tol=tol):
-                    continue
-            blocks.append(Line(*new_block.edge_coordinates(edge)))
+        M = np.asarray(T.matrix, dtype=float) @ np.asarray(R.matrix, dtype=float)
+        # the rotation is about the center, so the displaced center is only translated
+        nodes.append(Point(*(np.asarray(center, dtype=float) + displacement[0:3])))
+        edges, segments = _edge_segments(block)
+        if tol != 0.0:
+            segments = segments[~_coplanar_mask(block, edges, segments, tol)]
+        segments = segments @ M[:3, :3].T + M[:3, 3]
+        blocks.append(segments)
+    blocks = _lines(blocks)
     if len(blocks) != 0:
         viewer.scene.add(blocks, linewidth=1, linecolor=Color(0.7, 0.7, 0.7))
     if len(nodes) != 0:
         viewer.scene.add(nodes, pointcolor=Color(0.7, 0.7, 0.7))
 
 
-def draw_weights(assembly, viewer, scale=1.0, density=1.0):
+def draw_weights(assembly, viewer, scale=1.0, density=1.0, snapshot=None):
+    nodes, _, node_attrs, _ = snapshot or _snapshot(assembly.graph)
     weights = []
     blocks = []
     supports = []
     # total_weights = 0
-    for node in assembly.graph.nodes():
-        block = assembly.graph.node_attribute(node, "block")
-        if assembly.graph.node_attribute(node, "is_support"):
-            supports.append(Point(*block.center()))
+    for node in nodes:
+        is_support = node_attrs[node]["is_support"]
+        block = node_attrs[node]["block"]
+        center = block.center()
+        if is_support:
+            supports.append(Point(*center))
             continue
         d = block.attributes["density"] if "density" in block.attributes else density
+        volume = block.volume()
         weights.append(
             Arrow(
-                block.center(),
-                [0, 0, -block.volume() * d * scale],
+                center,
+                [0, 0, -volume * d * scale],
                 linewidth=0.02,
             )
         )
-        # print("self-weight", -block.volume() * density)
-        # total_weights += block.volume() * 2500 * 9.8
-        blocks.append(Point(*block.center()))
+        # print("self-weight", -volume * density)
+        # total_weights += volume * 2500 * 9.8
+        blocks.append(Point(*center))
 
     # print("total self-weight: ", total_weights)
 
@@ -445,9 +511,7 @@ def draw_weights(assembly, viewer, scale=1.0, density=1.0):
         viewer.scene.add(supports, pointsize=20, pointcolor=Color.from_hex("#ee6352"))
     if len(blocks) != 0:
         viewer.scene.add(blocks, pointsize=30, pointcolor=Color.from_hex("#3284a0"))
-    if len(weights) != 0:
-        for weight in weights:
-            weight.add_to_scene(viewer, facecolor=Color.from_hex("#59cd90"))
+    Arrow.batch_add(weights, viewer, facecolor=Color.from_hex("#59cd90"))
 
 
 def cra_view(
@@ -512,20 +576,19 @@ def cra_view(
 
     viewer = Viewer(config=Config(vectorsize=0.15))
 
+    snapshot = _snapshot(assembly.graph)
+
     if blocks:
-        draw_blocks(assembly, viewer, edge, tol)
+        draw_blocks(assembly, viewer, edge, tol, snapshot=snapshot)
     if interfaces:
-        draw_interfaces(assembly, viewer)
-    if forces:
-        draw_forces(assembly, viewer, scale, resultant, nodal)
-    if forcesdirect:
-        draw_forcesdirect(assembly, viewer, scale, resultant, nodal)
-    if forcesline:
-        draw_forcesline(assembly, viewer, scale, resultant, nodal)
+        draw_interfaces(assembly, viewer, snapshot=snapshot)
+    modes = [mode for mode, show in (("legacy", forces), ("direct", forcesdirect), ("line", forcesline)) if show]
+    if modes:
+        _draw_all_forces(assembly, viewer, scale, resultant, nodal, modes=modes, snapshot=snapshot)
     if weights:
-        draw_weights(assembly, viewer, scale, density)
+        draw_weights(assembly, viewer, scale, density, snapshot=snapshot)
     if displacements:
-        draw_displacements(assembly, viewer, dispscale, tol)
+        draw_displacements(assembly, viewer, dispscale, tol, snapshot=snapshot)
 
     viewer.show()
 
@@ -590,17 +653,16 @@ def cra_view_ex(
     None
     """
 
+    snapshot = _snapshot(assembly.graph)
+
     if blocks:
-        draw_blocks(assembly, viewer, edge, tol)
+        draw_blocks(assembly, viewer, edge, tol, snapshot=snapshot)
     if interfaces:
-        draw_interfaces(assembly, viewer)
-    if forces:
-        draw_forces(assembly, viewer, scale, resultant, nodal)
-    if forcesdirect:
-        draw_forcesdirect(assembly, viewer, scale, resultant, nodal)
-    if forcesline:
-        draw_forcesline(assembly, viewer, scale, resultant, nodal)
+        draw_interfaces(assembly, viewer, snapshot=snapshot)
+    modes = [mode for mode, show in (("legacy", forces), ("direct", forcesdirect), ("line", forcesline)) if show]
+    if modes:
+        _draw_all_forces(assembly, viewer, scale, resultant, nodal, modes=modes, snapshot=snapshot)
     if weights:
-        draw_weights(assembly, viewer, scale, density)
+        draw_weights(assembly, viewer, scale, density, snapshot=snapshot)
     if displacements:
-        draw_displacements(assembly, viewer, dispscale, tol)
+        draw_displacements(assembly, viewer, dispscale, tol, snapshot=snapshot)
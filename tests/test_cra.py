@@ -1,9 +1,14 @@
+import pickle
+
+import pyomo.environ as pyo
+from pyomo.opt import SolverResults
 from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Frame
 from compas.geometry import Translation
 from compas_assembly.datastructures import Block
 from compas_cra.datastructures import CRA_Assembly
+from compas_cra.equilibrium import model_cache
 from compas_cra.equilibrium import cra_solve
 
 
@@ -40,3 +45,75 @@ def test_cra():
                     IS_FORCE_CORRECT = False
 
     assert IS_FORCE_CORRECT
+
+
+def test_cra_resolve():
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    interface1 = Mesh()
+    # interface corners
+    corners = [[0.5, 0.5, 0.5], [-0.5, 0.5, 0.5], [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5]]
+    for i, c in enumerate(corners):
+        interface1.add_vertex(key=i, x=c[0], y=c[1], z=c[2])
+    interface1.add_face([0, 1, 2, 3])
+
+    assembly.add_interfaces_from_meshes([interface1], 0, 1)
+
+    cra_solve(assembly, density=1)
+    model = model_cache(assembly)["cra_model"][1]
+    cra_solve(assembly, density=2, warm_start=True)  # reuses the model of the first solve
+    assert model_cache(assembly)["cra_model"][1] is model
+
+    for edge in assembly.graph.edges():
+        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
+            for force in interface.forces:
+                assert round(force["c_np"] - force["c_nn"], 2) == 0.5
+
+    cra_solve(assembly, mu=0.5, density=2)  # a new friction coefficient replaces the model
+    assert model_cache(assembly)["cra_model"][0] == 0.5
+    assert model_cache(assembly)["cra_model"][1] is not model
+
+
+class _StubSolver:
+    """Stand-in for IPOPT that reports an optimal solve and keeps the initial values."""
+
+    def __init__(self, *args, **kwargs):
+        self.options = {}
+
+    def solve(self, model, tee=False):
+        result = SolverResults()
+        result.solver.termination_condition = pyo.TerminationCondition.optimal
+        return result
+
+
+def test_cra_pickle(monkeypatch):
+    monkeypatch.setattr(pyo, "SolverFactory", _StubSolver)
+
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    interface1 = Mesh()
+    # interface corners
+    corners = [[0.5, 0.5, 0.5], [-0.5, 0.5, 0.5], [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5]]
+    for i, c in enumerate(corners):
+        interface1.add_vertex(key=i, x=c[0], y=c[1], z=c[2])
+    interface1.add_face([0, 1, 2, 3])
+
+    assembly.add_interfaces_from_meshes([interface1], 0, 1)
+
+    cra_solve(assembly, density=1)
+    assert "cra_model" in model_cache(assembly)
+
+    copy = pickle.loads(pickle.dumps(assembly))  # the cached model is not part of the assembly
+    assert copy.graph.number_of_nodes() == 2
@@ -0,0 +1,48 @@
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas_assembly.datastructures import Block
+from compas_cra.datastructures import CRA_Assembly
+from compas_cra.algorithms import assembly_interfaces_numpy
+from compas_cra.equilibrium import equilibrium_setup
+from compas_cra.equilibrium import friction_setup
+
+
+def test_setup_cache():
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0.75, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    assembly_interfaces_numpy(assembly, amin=1e-6, tmax=1e-4)
+
+    aeq = equilibrium_setup(assembly)
+    assert equilibrium_setup(assembly) is aeq
+
+    assembly.move_block(1, [0, 0, 0.1])
+    moved = equilibrium_setup(assembly)
+    assert moved is not aeq
+    assert (moved != aeq).nnz > 0
+
+
+def test_friction_cache():
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0.75, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    assembly_interfaces_numpy(assembly, amin=1e-6, tmax=1e-4)
+
+    afr = friction_setup(assembly, 0.5)
+    assert friction_setup(assembly, 0.5) is afr
+
+    for mu in (0.6, 0.7, 0.8):
+        friction_setup(assembly, mu)
+    assert friction_setup(assembly, 0.8) is friction_setup(assembly, 0.8)
+    assert friction_setup(assembly, 0.5) is not afr  # only the last mu is kept
@@ -32,3 +32,28 @@ def test_cra_penalty():
                 resultant += force
 
     assert round(weight, 2) == round(resultant, 2)
+
+
+def test_cra_penalty_resolve():
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0.75, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    assembly_interfaces_numpy(assembly, amin=1e-6, tmax=1e-4)
+
+    cra_penalty_solve(assembly, density=1)
+    cra_penalty_solve(assembly, density=2)  # reuses the model of the first solve
+
+    block = assembly.graph.node_attribute(1, "block")
+    weight = 2 * block.volume()
+    resultant = 0
+    for edge in assembly.graph.edges():
+        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
+            for force in interface.forces:
+                resultant += force["c_np"] - force["c_nn"]
+
+    assert round(weight, 2) == round(resultant, 2)
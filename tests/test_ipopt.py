@@ -1,4 +1,6 @@
 import pyomo.environ as pyo
+from compas_cra.equilibrium import ipopt_solve
+from compas_cra.equilibrium import ipopt_solver
 
 
 def test_ipopt():
@@ -9,3 +11,14 @@ def test_ipopt():
     with pyo.SolverFactory("ipopt") as solver:
         result = solver.solve(model, tee=True)
         assert result.Solver._active
+
+
+def test_ipopt_hsl_fallback():
+    model = pyo.ConcreteModel()
+    model.x = pyo.Var([1, 2], domain=pyo.NonNegativeReals)
+    model.OBJ = pyo.Objective(expr=2 * model.x[1] + 3 * model.x[2])
+    model.Constraint1 = pyo.Constraint(expr=3 * model.x[1] + 4 * model.x[2] >= 1)
+    solver = ipopt_solver(linear_solver="ma57", hsllib="libdoesnotexist.so")  # HSL library cannot be loaded
+    result = ipopt_solve(solver, model)
+    assert result.solver.termination_condition is pyo.TerminationCondition.optimal
+    assert "linear_solver" not in solver.options
@@ -4,6 +4,7 @@ from compas.geometry import Translation
 from compas_assembly.datastructures import Block
 from compas_cra.datastructures import CRA_Assembly
 from compas_cra.algorithms import assembly_interfaces_numpy
+from compas_cra.equilibrium import model_cache
 from compas_cra.equilibrium import rbe_solve
 
 
@@ -32,3 +33,34 @@ def test_cra_penalty():
                 resultant += force
 
     assert round(weight, 2) == round(resultant, 2)
+
+
+def test_rbe_resolve():
+    support = Box(1, 1, 1)  # supporting block
+    free1 = Box(1, 1, 1, frame=Frame.worldXY().transformed(Translation.from_vector([0.75, 0, 1])))  # block to analyse
+
+    assembly = CRA_Assembly()
+    assembly.add_block(Block.from_shape(support), node=0)
+    assembly.add_block(Block.from_shape(free1), node=1)
+    assembly.set_boundary_conditions([0])
+
+    assembly_interfaces_numpy(assembly, amin=1e-6, tmax=1e-4)
+
+    rbe_solve(assembly, density=1)
+    model = model_cache(assembly)["rbe_model"][1]
+    rbe_solve(assembly, density=2, warm_start=True)  # reuses the model of the first solve
+    assert model_cache(assembly)["rbe_model"][1] is model
+
+    block = assembly.graph.node_attribute(1, "block")
+    weight = 2 * block.volume()
+    resultant = 0
+    for edge in assembly.graph.edges():
+        for interface in assembly.graph.edge_attribute(edge, "interfaces"):
+            for force in interface.forces:
+                resultant += force["c_np"] - force["c_nn"]
+
+    assert round(weight, 2) == round(resultant, 2)
+
+    rbe_solve(assembly, mu=0.5, density=2)  # a new friction coefficient replaces the model
+    assert model_cache(assembly)["rbe_model"][0] == 0.5
+    assert model_cache(assembly)["rbe_model"][1] is not model